@@ -0,0 +1,83 @@
+import json
+import os
+
+# ======================================================
+# CONFIGURATION
+# ======================================================
+SAVE_FILE = "savegame.json"
+
+ACTIONS = ["Search", "Move", "Wait", "Fight"]
+
+# HP change per turn (negative = damage); actions not listed leave HP alone
+ACTION_HP = {"Fight": 0}
+
+# ======================================================
+# GAME STATE
+# ======================================================
+# Kept free of pygame so the rules can run headless (see simulator.py).
+class GameState:
+    def __init__(self):
+        self.max_hp = 100
+        self.hp = self.max_hp
+        self.inventory = ["Torch"]
+        self.quests = [{"text": "Placeholder objective.", "state": "Active"}]
+
+    def damage(self, amount):
+        self.hp = max(0, self.hp - amount)
+        return self.hp == 0
+
+    def heal(self, amount):
+        self.hp = min(self.max_hp, self.hp + amount)
+
+    def save(self):
+        with open(SAVE_FILE, "w") as f:
+            json.dump(self.__dict__, f, indent=2)
+
+    def load(self):
+        if not os.path.exists(SAVE_FILE):
+            return False
+        with open(SAVE_FILE) as f:
+            self.__dict__.update(json.load(f))
+        # Safety clamp after load
+        self.hp = max(0, min(self.hp, self.max_hp))
+        return True
+
+
+# ======================================================
+# ACTIONS
+# ======================================================
+# Resolves one turn; returns True if it was fatal
+def apply_action(state, action):
+    if action not in ACTIONS:
+        raise ValueError(f"Unknown action: {action}")
+    delta = ACTION_HP.get(action)
+    if delta is None:
+        return False
+    if delta > 0:
+        state.heal(delta)
+        return False
+    return state.damage(-delta)
+
+# Same result as apply_action() repeated until death or `turns` runs out,
+# in constant time; returns (turns_played, died)
+def fast_forward(state, action, turns):
+    if action not in ACTIONS:
+        raise ValueError(f"Unknown action: {action}")
+    if turns <= 0:
+        return 0, False
+    delta = ACTION_HP.get(action)
+    if delta is None:
+        return turns, False
+    if delta > 0:
+        state.heal(delta * turns)
+        return turns, False
+    if delta == 0:
+        # Zero damage is only fatal when already at 0 HP, on the first turn
+        return (1, True) if state.damage(0) else (turns, False)
+
+    turns_to_death = -(-state.hp // -delta)
+    if turns_to_death <= turns:
+        state.damage(state.hp)
+        return max(turns_to_death, 1), True
+    state.damage(-delta * turns)
+    return turns, False
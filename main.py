@@ -1,16 +1,19 @@
 import pygame
 import sys
-import json
 import os
+import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from gamestate import ACTIONS, GameState, apply_action, fast_forward
 
 # ======================================================
 # CONFIGURATION
 # ======================================================
 FPS = 60
 FONT_SIZE = 18
-SAVE_FILE = "savegame.json"
 TYPE_SPEED = 40  # characters per second
+FAST_FORWARD_TURNS = 10  # turns resolved by Shift + action
 
 BG_COLOR = (20, 20, 20)
 TEXT_COLOR = (200, 200, 200)
@@ -24,6 +27,7 @@ DEFAULT_RES = (1920, 1080)
 VIRTUAL_RES = (1920, 1080)
 
 ANIM_SPEED = 10
+PIPELINED_PRESENT = False  # scale on a worker thread; adds a frame of lag, gain unproven
 
 # ======================================================
 # INITIALISATION
@@ -72,6 +76,51 @@ def cycle_resolution():
     current_res_index = (current_res_index + 1) % len(RESOLUTIONS)
     apply_display_mode()
 
+# ======================================================
+# PRESENTATION
+# ======================================================
+# Pipelined: frame N is scaled on a worker thread while frame N+1 is drawn
+# into the other buffer, and flipped one frame late.
+class Presenter:
+    def __init__(self, pipelined=PIPELINED_PRESENT):
+        self.pipelined = pipelined
+        self.buffers = [ui_surface]
+        self.back = 0
+        self.pending = None
+        self.executor = None
+        if pipelined:
+            self.buffers.append(pygame.Surface(VIRTUAL_RES))
+            self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def present(self):
+        global ui_surface
+        size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        if not self.pipelined:
+            self._flip(pygame.transform.smoothscale(ui_surface, size))
+            return
+
+        # Show the previous frame; its buffer is free to draw into afterwards
+        if self.pending:
+            self._flip(self.pending.result())
+        self.pending = self.executor.submit(pygame.transform.smoothscale, ui_surface, size)
+        self.back ^= 1
+        ui_surface = self.buffers[self.back]
+
+    def _flip(self, scaled):
+        # A frame scaled before a display mode change is dropped
+        if scaled.get_size() != screen.get_size():
+            return
+        screen.blit(scaled, (0, 0))
+        pygame.display.flip()
+
+    def close(self):
+        if self.pending:
+            self._flip(self.pending.result())
+            self.pending = None
+        if self.executor:
+            self.executor.shutdown()
+            self.executor = None
+
 # ======================================================
 # HELPERS
 # ======================================================
@@ -208,6 +257,17 @@ class Terminal:
     def add(self, text):
         self.queue.append(text)
 
+    # Shows a line immediately, finishing anything still being typed
+    def post(self, text):
+        if self.current or self.typed:
+            self.lines.append(self.typed + self.current)
+        self.lines.extend(self.queue)
+        self.queue.clear()
+        self.current = ""
+        self.typed = ""
+        self.timer = 0
+        self.lines.append(text)
+
     def update(self, dt):
         if not self.current and self.queue:
             self.current = self.queue.popleft()
@@ -241,37 +301,6 @@ class Terminal:
             ui_surface.blit(font_term.render(self.typed, True, TEXT_COLOR), (10, y))
 
 
-# ======================================================
-# GAME STATE
-# ======================================================
-class GameState:
-    def __init__(self):
-        self.max_hp = 100
-        self.hp = self.max_hp
-        self.inventory = ["Torch"]
-        self.quests = [{"text": "Placeholder objective.", "state": "Active"}]
-
-    def damage(self, amount):
-        self.hp = max(0, self.hp - amount)
-        return self.hp == 0
-
-    def heal(self, amount):
-        self.hp = min(self.max_hp, self.hp + amount)
-
-    def save(self):
-        with open(SAVE_FILE, "w") as f:
-            json.dump(self.__dict__, f, indent=2)
-
-    def load(self):
-        if not os.path.exists(SAVE_FILE):
-            return False
-        with open(SAVE_FILE) as f:
-            self.__dict__.update(json.load(f))
-        # Safety clamp after load
-        self.hp = max(0, min(self.hp, self.max_hp))
-        return True
-
-
 # ======================================================
 # INVENTORY PANEL
 # ======================================================
@@ -307,11 +336,12 @@ class InventoryPanel:
 # ======================================================
 class ActionButtons:
     def __init__(self, terminal):
-        self.labels = ["Search", "Move", "Wait", "Fight"]
+        self.labels = list(ACTIONS)
         self.selected = 0
         self.rects = []
         self.terminal = terminal
         self.last_action = None
+        self.fast_forward = False
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -320,14 +350,19 @@ class ActionButtons:
             elif event.key in (pygame.K_s, pygame.K_DOWN):
                 self.selected = (self.selected + 1) % len(self.labels)
             elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                self.last_action = self.labels[self.selected]
-                self.terminal.add(f"> {self.last_action}")
+                self.choose(self.labels[self.selected], event.mod)
 
 
         for lbl, r in self.rects:
             if button_clicked(r, event):
-                self.last_action = lbl
-                self.terminal.add(f"> {lbl}")
+                self.choose(lbl, pygame.key.get_mods())
+
+    def choose(self, lbl, mods):
+        self.last_action = lbl
+        # Holding Shift fast-forwards; the summary is posted once resolved
+        self.fast_forward = bool(mods & pygame.KMOD_SHIFT)
+        if not self.fast_forward:
+            self.terminal.add(f"> {lbl}")
 
 
     def draw(self):
@@ -516,6 +551,7 @@ def main():
     main_menu = MainMenu()
     options_menu = OptionsMenu()
     game_over_menu = GameOverMenu()
+    presenter = Presenter()
 
 
     terminal.add("Awaiting...")
@@ -623,21 +659,19 @@ def main():
                         handle_pause_choice(choice, state, terminal, transition)
                 elif not inventory.visible:
                     actions.handle_event(event)
-
-
-                if actions.last_action == "Fight":
-                    actions.last_action = None  # consume action
-                    if state.damage(0):
-                        terminal.add(">> SYSTEM FAILURE: Vital signs terminated.")
-                        terminal.add("Load last saved game?")
-                        mode = "game_over"
-
-
-
-
-                # Gameplay input ONLY when not pause_menu.active
-                elif not inventory.visible:
-                    actions.handle_event(event)
+                    if actions.last_action:
+                        action = actions.last_action
+                        actions.last_action = None  # consume action
+                        if actions.fast_forward:
+                            hp_before = state.hp
+                            turns, died = fast_forward(state, action, FAST_FORWARD_TURNS)
+                            terminal.post(f"> {action} x{turns} (HP {hp_before} -> {state.hp})")
+                        else:
+                            died = apply_action(state, action)
+                        if died:
+                            terminal.add(">> SYSTEM FAILURE: Vital signs terminated.")
+                            terminal.add("Load last saved game?")
+                            mode = "game_over"
 
             # --- GAME OVER ---
             elif mode == "game_over":
@@ -676,11 +710,9 @@ def main():
 
 
         transition.draw()
+        presenter.present()
 
-        scaled = pygame.transform.smoothscale(ui_surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        screen.blit(scaled, (0, 0))
-        pygame.display.flip()
-
+    presenter.close()
     pygame.quit()
     sys.exit()
 
@@ -705,6 +737,42 @@ def set_mode(m):
 
 
 
+# Serial vs pipelined presentation at the windowed resolutions, upscales above
+# VIRTUAL_RES, and the default fullscreen desktop mode
+BENCH_UPSCALE_RES = [(2560, 1440), (3840, 2160)]
+
+def benchmark_present(frames=300):
+    global screen, SCREEN_WIDTH, SCREEN_HEIGHT
+    terminal = Terminal()
+    for i in range(terminal.lines.maxlen):
+        terminal.lines.append(f"> Benchmark line {i:02d} " + "." * 60)
+
+    targets = [(size, 0, "windowed") for size in RESOLUTIONS + BENCH_UPSCALE_RES]
+    targets.append((DESKTOP_RES, pygame.NOFRAME, "fullscreen"))
+    for size, flags, label in targets:
+        screen = pygame.display.set_mode(size, flags)
+        SCREEN_WIDTH, SCREEN_HEIGHT = screen.get_size()
+        results = {}
+        for pipelined in (False, True):
+            presenter = Presenter(pipelined)
+            start = time.perf_counter()
+            for _ in range(frames):
+                pygame.event.pump()
+                ui_surface.fill(BG_COLOR)
+                terminal.draw()
+                presenter.present()
+            presenter.close()
+            results[pipelined] = frames / (time.perf_counter() - start)
+
+        print(f"Presenting {VIRTUAL_RES[0]}x{VIRTUAL_RES[1]} -> {SCREEN_WIDTH}x{SCREEN_HEIGHT} ({label})")
+        print(f"  serial:    {results[False]:7.1f} fps")
+        print(f"  pipelined: {results[True]:7.1f} fps ({results[True] / results[False]:.2f}x)")
+    pygame.quit()
+
+
 if __name__ == "__main__":
-    main()
+    if "--bench-present" in sys.argv:
+        benchmark_present()
+    else:
+        main()
 
@@ -0,0 +1,165 @@
+# Headless playthrough simulator: plays action sequences against GameState
+# without pygame, fanned out across a process pool. Scaling with core count
+# is unverified; it has only been measured on a single CPU.
+#
+#   python simulator.py --runs 100000 --turns 50
+#   python simulator.py --exhaustive --turns 8 --workers 4
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+from gamestate import ACTIONS, GameState, apply_action
+
+DEFAULT_TURNS = 50
+DEFAULT_EXHAUSTIVE_TURNS = 8
+EXHAUSTIVE_LIMIT = 1_000_000  # most sequences an exhaustive run may enumerate
+
+# ======================================================
+# SIMULATION
+# ======================================================
+def state_key(state):
+    quests = tuple((q["text"], q["state"]) for q in state.quests)
+    return state.hp, state.max_hp, tuple(state.inventory), quests
+
+# Returns (state, turns_played, died, visited state keys); stops at death
+def play(actions, state=None):
+    state = state or GameState()
+    visited = {state_key(state)}
+    for turn, action in enumerate(actions, 1):
+        died = apply_action(state, action)
+        visited.add(state_key(state))
+        if died:
+            return state, turn, True, visited
+    return state, len(actions), False, visited
+
+# Dead ends are not reported yet. The rules have no goal or quest progress,
+# and every action except a damaging Fight leaves the state unchanged, so
+# any dead-end test would just flag the start state.
+
+
+# ======================================================
+# BATCH RUNNER
+# ======================================================
+def _new_stats():
+    return {"runs": 0, "deaths": 0, "death_turns": 0, "visited": set()}
+
+def _record(stats, actions):
+    _, turns, died, visited = play(actions)
+    stats["runs"] += 1
+    stats["visited"] |= visited
+    if died:
+        stats["deaths"] += 1
+        stats["death_turns"] += turns
+
+def _run_random(chunk):
+    seed, runs, turns = chunk
+    rng = random.Random(seed)
+    stats = _new_stats()
+    for _ in range(runs):
+        _record(stats, [rng.choice(ACTIONS) for _ in range(turns)])
+    return stats
+
+def _run_exhaustive(chunk):
+    prefix, turns = chunk
+    stats = _new_stats()
+    for suffix in product(ACTIONS, repeat=turns - len(prefix)):
+        _record(stats, prefix + suffix)
+    return stats
+
+def _warm_up(_):
+    # Busy long enough that each submit needs a fresh worker
+    time.sleep(0.1)
+
+def _random_chunks(runs, turns, chunks, seed):
+    rng = random.Random(seed)
+    size, extra = divmod(runs, chunks)
+    for i in range(chunks):
+        count = size + (i < extra)
+        if count:
+            yield rng.getrandbits(64), count, turns
+
+def _exhaustive_chunks(turns, chunks):
+    # Split on the shortest action prefix that gives every worker enough chunks
+    depth = 0
+    while depth < turns and len(ACTIONS) ** depth < chunks:
+        depth += 1
+    for prefix in product(ACTIONS, repeat=depth):
+        yield prefix, turns
+
+# Random mode plays `runs` random sequences; exhaustive mode plays every
+# sequence of `turns` actions and ignores `runs`
+def simulate(runs=10000, turns=None, exhaustive=False, workers=None, seed=None):
+    if turns is None:
+        turns = DEFAULT_EXHAUSTIVE_TURNS if exhaustive else DEFAULT_TURNS
+    if runs < 0:
+        raise ValueError(f"runs must be at least 0, got {runs}")
+    if turns < 0:
+        raise ValueError(f"turns must be at least 0, got {turns}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if exhaustive and len(ACTIONS) ** turns > EXHAUSTIVE_LIMIT:
+        raise ValueError(
+            f"{len(ACTIONS)}**{turns} sequences exceeds the exhaustive limit "
+            f"of {EXHAUSTIVE_LIMIT}; use fewer turns or random mode"
+        )
+    workers = workers or os.cpu_count() or 1
+    chunks = workers * 4  # a few chunks per worker evens out uneven ones
+    if exhaustive:
+        job, work = _run_exhaustive, list(_exhaustive_chunks(turns, chunks))
+    else:
+        job, work = _run_random, list(_random_chunks(runs, turns, chunks, seed))
+
+    if workers == 1:
+        start = time.perf_counter()
+        total = _merge(map(job, work))
+        elapsed = time.perf_counter() - start
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Bring every worker up first so pool startup isn't timed
+            list(pool.map(_warm_up, range(workers)))
+            start = time.perf_counter()
+            total = _merge(pool.map(job, work))
+            elapsed = time.perf_counter() - start
+    total["elapsed"] = elapsed
+    total["workers"] = workers
+    return total
+
+def _merge(results):
+    total = _new_stats()
+    for stats in results:
+        total["runs"] += stats["runs"]
+        total["deaths"] += stats["deaths"]
+        total["death_turns"] += stats["death_turns"]
+        total["visited"] |= stats["visited"]
+    return total
+
+def report(stats):
+    runs = stats["runs"]
+    deaths = stats["deaths"]
+    print(f"Playthroughs:     {runs} in {stats['elapsed']:.2f}s on {stats['workers']} worker(s)")
+    print(f"Throughput:       {runs / stats['elapsed']:.0f} playthroughs/s")
+    print(f"Reachable states: {len(stats['visited'])}")
+    print(f"HP deaths:        {deaths} ({100 * deaths / max(runs, 1):.1f}%)", end="")
+    if deaths:
+        print(f", mean turn {stats['death_turns'] / deaths:.1f}")
+    else:
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless playthrough simulator")
+    parser.add_argument("--runs", type=int, default=10000)
+    parser.add_argument("--turns", type=int, default=None,
+                        help=f"default {DEFAULT_TURNS}, or {DEFAULT_EXHAUSTIVE_TURNS} with --exhaustive")
+    parser.add_argument("--exhaustive", action="store_true")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    try:
+        stats = simulate(args.runs, args.turns, args.exhaustive, args.workers, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    report(stats)
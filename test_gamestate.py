@@ -0,0 +1,44 @@
+# fast_forward() must match resolving turns one at a time.
+# Runs under pytest, or directly with `python test_gamestate.py`.
+from itertools import product
+
+import gamestate
+from gamestate import ACTIONS, GameState, apply_action, fast_forward
+
+FIGHT_DELTAS = [0, -1, -7, -30, -100, -150]
+WAIT_DELTAS = [None, 0, 3]  # None leaves Wait out of ACTION_HP
+START_HP = [0, 1, 5, 50, 99, 100]
+TURNS = [0, 1, 2, 3, 13, 40, 1000]
+
+
+def step_by_step(state, action, turns):
+    for turn in range(1, turns + 1):
+        if apply_action(state, action):
+            return turn, True
+    return turns, False
+
+
+def test_fast_forward_matches_apply_action():
+    saved = dict(gamestate.ACTION_HP)
+    try:
+        for fight, wait in product(FIGHT_DELTAS, WAIT_DELTAS):
+            gamestate.ACTION_HP.clear()
+            gamestate.ACTION_HP["Fight"] = fight
+            if wait is not None:
+                gamestate.ACTION_HP["Wait"] = wait
+            for hp, action, turns in product(START_HP, ACTIONS, TURNS):
+                slow, fast = GameState(), GameState()
+                slow.hp = fast.hp = hp
+                expected = step_by_step(slow, action, turns)
+                got = fast_forward(fast, action, turns)
+                case = (fight, wait, hp, action, turns)
+                assert got == expected, case
+                assert fast.hp == slow.hp, case
+    finally:
+        gamestate.ACTION_HP.clear()
+        gamestate.ACTION_HP.update(saved)
+
+
+if __name__ == "__main__":
+    test_fast_forward_matches_apply_action()
+    print("fast_forward matches apply_action")
@@ -0,0 +1,102 @@
+# Simulator work splitting, merging and death accounting.
+# Runs under pytest, or directly with `python test_simulator.py`.
+from contextlib import contextmanager
+from itertools import product
+
+import gamestate
+import simulator
+from gamestate import ACTIONS
+
+
+@contextmanager
+def fight_delta(delta):
+    saved = dict(gamestate.ACTION_HP)
+    gamestate.ACTION_HP["Fight"] = delta
+    try:
+        yield
+    finally:
+        gamestate.ACTION_HP.clear()
+        gamestate.ACTION_HP.update(saved)
+
+
+def without_timing(stats):
+    return {k: v for k, v in stats.items() if k != "elapsed"}
+
+
+def test_exhaustive_chunks_cover_every_sequence_once():
+    turns = 5
+    for workers in (1, 2, 3, 5, 64, 300):
+        sequences = [
+            prefix + suffix
+            for prefix, _ in simulator._exhaustive_chunks(turns, workers * 4)
+            for suffix in product(ACTIONS, repeat=turns - len(prefix))
+        ]
+        assert len(sequences) == len(ACTIONS) ** turns, workers
+        assert len(set(sequences)) == len(sequences), workers
+
+
+def test_exhaustive_runs_every_sequence():
+    for workers in (1, 2, 3):
+        stats = simulator.simulate(turns=4, exhaustive=True, workers=workers)
+        assert stats["runs"] == len(ACTIONS) ** 4, workers
+
+
+def test_random_chunks_split_runs_exactly():
+    for runs, chunks in [(0, 4), (3, 8), (10, 12), (1001, 16)]:
+        counts = [count for _, count, _ in simulator._random_chunks(runs, 5, chunks, 0)]
+        assert sum(counts) == runs
+        assert all(count > 0 for count in counts)
+
+
+def test_random_mode_is_reproducible():
+    with fight_delta(-7):
+        first = simulator.simulate(runs=500, turns=30, workers=1, seed=7)
+        second = simulator.simulate(runs=500, turns=30, workers=1, seed=7)
+    assert without_timing(first) == without_timing(second)
+    assert first["runs"] == 500
+    assert first["deaths"] > 0
+
+
+def test_play_stops_at_death():
+    with fight_delta(-30):
+        state, turns, died, visited = simulator.play(["Wait"] + ["Fight"] * 10)
+    assert (turns, died, state.hp) == (5, True, 0)
+    assert {key[0] for key in visited} == {100, 70, 40, 10, 0}
+
+
+def test_death_counts_match_brute_force():
+    # At -50 per Fight, the second Fight is fatal
+    turns = 5
+    deaths = death_turns = 0
+    for sequence in product(ACTIONS, repeat=turns):
+        fights = [i for i, action in enumerate(sequence) if action == "Fight"]
+        if len(fights) >= 2:
+            deaths += 1
+            death_turns += fights[1] + 1
+
+    with fight_delta(-50):
+        stats = simulator.simulate(turns=turns, exhaustive=True, workers=1)
+    assert stats["deaths"] == deaths
+    assert stats["death_turns"] == death_turns
+
+
+def test_invalid_arguments_are_rejected():
+    for kwargs in [
+        {"runs": -5},
+        {"turns": -1},
+        {"turns": -1, "exhaustive": True},
+        {"workers": 0},
+        {"turns": 50, "exhaustive": True},
+    ]:
+        try:
+            simulator.simulate(**kwargs)
+        except ValueError:
+            continue
+        raise AssertionError(f"simulate({kwargs}) did not raise")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+    print("simulator checks passed")